@@ -0,0 +1,267 @@
+"""Mede extração de PDFs, busca na loja e geração de PDFs, sem acesso à rede.
+
+Uso:
+    python benchmarks/bench_orcamento.py                      # mede e compara com a linha de base
+    python benchmarks/bench_orcamento.py --atualizar          # regrava a linha de base
+    python benchmarks/bench_orcamento.py --grupos renderizacao --limite 0.5
+
+Grupos de casos:
+
+    extracao      `extrair_informacoes` em notas sintéticas de 10, 100 e 1.000 páginas
+    loja          `buscar_produto_por_url` e `buscar_produtos_por_ids` contra o servidor local
+                  de `loja_local.py` (páginas salvas em `fixtures/loja/`)
+    renderizacao  `gerar_pdf` em todos os FORMATOS_PAGINA com 10, 100 e 1.000 produtos
+
+Para cada caso são registrados o menor tempo entre as repetições, o pico de memória
+alocada (tracemalloc, em uma execução à parte) e o tamanho da saída. O resultado sai com
+código 1 se algum caso piorar mais que `--limite` (fração) em relação a `linha_base.json`.
+Tempos dependem da máquina: regrave a linha de base ao trocar de ambiente.
+
+O tracemalloc só enxerga o processo principal; acima de PAGINAS_PARA_PROCESSOS páginas a
+extração roda em processos filhos e o pico reportado não inclui a memória deles.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import BytesIO
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, PASTA)
+
+TEMPORARIO = tempfile.TemporaryDirectory(prefix="bench_orcamento_")
+# o cache de produtos do benchmark não deve se misturar ao do usuário
+os.environ["ORCAMENTO_CACHE_CAMINHO"] = os.path.join(TEMPORARIO.name, "produtos.sqlite3")
+
+from reportlab.lib.pagesizes import A4  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from loja_local import produto_esperado, servidor_loja  # noqa: E402
+from orcamento import loja  # noqa: E402
+from orcamento.extracao_pdf import extrair_informacoes  # noqa: E402
+from orcamento.layout_pdf import gerar_pdf  # noqa: E402
+from orcamento.renderizacao import (  # noqa: E402
+    ALTURA_LOGO_PADRAO_CM,
+    FORMATOS_PAGINA,
+    MARGENS_PADRAO,
+    TITULO_GRANDE_PADRAO,
+    TITULO_PEQUENO_PADRAO,
+    logo_rodape,
+)
+
+LINHA_BASE = os.path.join(PASTA, "linha_base.json")
+GRUPOS = ("extracao", "loja", "renderizacao")
+PAGINAS_NOTA = (10, 100, 1000)
+PRODUTOS_POR_PAGINA_NOTA = 10
+QUANTIDADES_PRODUTOS = (10, 100, 1000)
+SKUS_LOTE = 50
+TOLERANCIA_TEMPO_S = 0.01  # diferenças menores que isso são ruído, qualquer que seja a fração
+TEMPO_MINIMO_S = 0.5  # casos rápidos repetem até somar este tempo (no máximo MAX_REPETICOES)
+MAX_REPETICOES = 50
+METRICAS = ("tempo_s", "memoria_pico_bytes", "bytes_saida")
+
+
+def gerar_nota_sintetica(caminho, paginas):
+    """Grava uma nota de fornecedor com PRODUTOS_POR_PAGINA_NOTA itens por página."""
+    c = canvas.Canvas(caminho, pagesize=A4)
+    item = 0
+    for _ in range(paginas):
+        c.setFont("Helvetica", 6)
+        y = A4[1] - 40
+        c.drawString(40, y, "NOTA DE PEDIDO - MUNDO DO ENXOVAL")
+        y -= 12
+        for _ in range(PRODUTOS_POR_PAGINA_NOTA):
+            item += 1
+            if item % 3 == 0:
+                preco = ["De", f"1.{item % 1000:03d},90", "Por", f"{item % 900 + 10},90"]
+            else:
+                preco = [f"{item % 900 + 10},90"]
+            for linha in [str(item), f"{100000 + item} - LENÇOL C/ELÁST. CASAL", "200X250 BRANCO",
+                          *preco, "2", f"{item % 900 + 20},80"]:
+                c.drawString(40, y, linha)
+                y -= 7
+        c.showPage()
+    c.save()
+
+
+def _produtos_sinteticos(quantidade):
+    produtos = []
+    for i in range(1, quantidade + 1):
+        nome = f"JOGO DE LENÇOL {i}" if i % 4 else f"JOGO DE CAMA QUEEN PERCAL 400 FIOS COM BORDADO INGLÊS {i}"
+        preco = f"De R$ {i % 900 + 200},90  Por R$ {i % 900 + 100},90" if i % 2 else f"R$ {i % 900 + 100},90"
+        produtos.append((nome, "200X250", preco))
+    return produtos
+
+
+def medir(funcao, repeticoes):
+    """Roda `funcao` ao menos `repeticoes` vezes e devolve menor tempo, pico de memória e tamanho da saída.
+
+    `funcao` devolve `(bytes_saida, itens)`.
+    """
+    tempos = []
+    while len(tempos) < repeticoes or (sum(tempos) < TEMPO_MINIMO_S and len(tempos) < MAX_REPETICOES):
+        inicio = time.perf_counter()
+        bytes_saida, itens = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"tempo_s": min(tempos), "memoria_pico_bytes": pico, "bytes_saida": bytes_saida, "itens": itens}
+
+
+def casos_extracao():
+    for paginas in PAGINAS_NOTA:
+        caminho = os.path.join(TEMPORARIO.name, f"nota_{paginas}.pdf")
+        gerar_nota_sintetica(caminho, paginas)
+        esperado = paginas * PRODUTOS_POR_PAGINA_NOTA
+
+        def extrair(caminho=caminho, esperado=esperado):
+            produtos = extrair_informacoes(caminho)
+            if len(produtos) != esperado:
+                raise AssertionError(f"{caminho}: {len(produtos)} produtos, esperado {esperado}")
+            return os.path.getsize(caminho), len(produtos)
+
+        yield f"extracao/nota_{paginas}_paginas", extrair
+
+
+def casos_loja(servidor):
+    loja.URL_LOJA = servidor.url
+
+    def _baixados(funcao):
+        antes = servidor.bytes_enviados
+        itens = funcao()
+        return servidor.bytes_enviados - antes, itens
+
+    def por_url():
+        url = f"{servidor.url}/jogo-de-lencol-1234/p?skuId=1234"
+        if loja.buscar_produto_por_url(url, forcar=True) != produto_esperado("1234"):
+            raise AssertionError(f"produto inesperado em {url}")
+        return 1
+
+    skus = [str(1000 + i) for i in range(SKUS_LOTE)]
+
+    def lote():
+        resultados = loja.buscar_produtos_por_ids(skus, forcar=True)
+        if resultados != [produto_esperado(sku) for sku in skus]:
+            raise AssertionError("lote de skuIds com resultado inesperado")
+        return len(resultados)
+
+    yield "loja/produto_por_url", lambda: _baixados(por_url)
+    yield f"loja/lote_{SKUS_LOTE}_skus", lambda: _baixados(lote)
+
+
+def casos_renderizacao():
+    logo = logo_rodape()
+    for nome_formato, tamanho_pagina in FORMATOS_PAGINA.items():
+        for quantidade in QUANTIDADES_PRODUTOS:
+            produtos = _produtos_sinteticos(quantidade)
+
+            def renderizar(produtos=produtos, tamanho_pagina=tamanho_pagina):
+                buffer = BytesIO()
+                gerar_pdf(produtos, buffer, tamanho_pagina, MARGENS_PADRAO, ALTURA_LOGO_PADRAO_CM,
+                          TITULO_GRANDE_PADRAO, TITULO_PEQUENO_PADRAO, logo=logo)
+                return buffer.getbuffer().nbytes, len(produtos)
+
+            formato = nome_formato.split(" (")[0].replace(" ", "_")
+            yield f"renderizacao/{formato}_{quantidade}_produtos", renderizar
+
+
+def comparar(atual, base, limite):
+    """Lista de (métrica, valor base, valor atual) que pioraram além do limite."""
+    pioras = []
+    for metrica in METRICAS:
+        antes, depois = base.get(metrica), atual.get(metrica)
+        if not antes or depois is None or depois <= antes * (1 + limite):
+            continue
+        if metrica == "tempo_s" and depois - antes < TOLERANCIA_TEMPO_S:
+            continue
+        pioras.append((metrica, antes, depois))
+    return pioras
+
+
+def _variacao(atual, base, metrica):
+    if not base or not base.get(metrica):
+        return "novo"
+    return f"{atual[metrica] / base[metrica] - 1:+.0%}"
+
+
+def executar(grupos, repeticoes, base, limite):
+    resultados = {}
+    regressoes = []
+    print(f"{'caso':<40}{'tempo':>10}{'Δ':>7}{'memória':>12}{'Δ':>7}{'saída':>11}{'itens':>7}")
+    with servidor_loja() as servidor:
+        fontes = {
+            "extracao": casos_extracao,
+            "loja": lambda: casos_loja(servidor),
+            "renderizacao": casos_renderizacao,
+        }
+        for grupo in grupos:
+            for nome, funcao in fontes[grupo]():
+                r = resultados[nome] = medir(funcao, repeticoes)
+                anterior = base.get(nome)
+                print(f"{nome:<40}{r['tempo_s'] * 1000:>8.1f}ms{_variacao(r, anterior, 'tempo_s'):>7}"
+                      f"{r['memoria_pico_bytes'] / 1024:>10.0f}KB{_variacao(r, anterior, 'memoria_pico_bytes'):>7}"
+                      f"{r['bytes_saida'] / 1024:>9.0f}KB{r['itens']:>7}")
+                if anterior:
+                    regressoes += [(nome, *piora) for piora in comparar(r, anterior, limite)]
+    return resultados, regressoes
+
+
+def _ambiente():
+    return {"python": platform.python_version(), "plataforma": platform.platform(), "cpus": os.cpu_count()}
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argumentos.add_argument("--grupos", nargs="+", choices=GRUPOS, default=list(GRUPOS))
+    argumentos.add_argument("--repeticoes", type=int, default=3)
+    argumentos.add_argument("--limite", type=float, default=0.25,
+                            help="piora tolerada em relação à linha de base (0.25 = 25%%)")
+    argumentos.add_argument("--linha-base", default=LINHA_BASE, help="arquivo JSON da linha de base")
+    argumentos.add_argument("--atualizar", action="store_true", help="regrava a linha de base com esta medição")
+    argumentos.add_argument("--relatorio", help="grava as medições desta execução em JSON neste caminho")
+    opcoes = argumentos.parse_args()
+    if opcoes.limite < 0 or opcoes.repeticoes < 1:
+        argumentos.error("--limite não pode ser negativo e --repeticoes deve ser ao menos 1")
+
+    base = {"casos": {}}
+    if os.path.exists(opcoes.linha_base):
+        with open(opcoes.linha_base, encoding="utf-8") as f:
+            base = json.load(f)
+        if base.get("ambiente") != _ambiente() and not opcoes.atualizar:
+            print(f"aviso: linha de base medida em outro ambiente ({base.get('ambiente')})\n", file=sys.stderr)
+
+    resultados, regressoes = executar(opcoes.grupos, opcoes.repeticoes, base["casos"], opcoes.limite)
+    medicao = {"ambiente": _ambiente(), "casos": resultados}
+
+    if opcoes.relatorio:
+        with open(opcoes.relatorio, "w", encoding="utf-8") as f:
+            json.dump(medicao, f, ensure_ascii=False, indent=2)
+    if opcoes.atualizar:
+        # grupos não medidos agora mantêm os valores anteriores
+        medicao["casos"] = {**base["casos"], **resultados}
+        with open(opcoes.linha_base, "w", encoding="utf-8") as f:
+            json.dump(medicao, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nlinha de base atualizada: {opcoes.linha_base}")
+        sys.exit(0)
+
+    if regressoes:
+        print(f"\n{len(regressoes)} regressão(ões) acima de {opcoes.limite:.0%}:")
+        for nome, metrica, antes, depois in regressoes:
+            print(f"  {nome}: {metrica} {antes:,.4g} -> {depois:,.4g} ({depois / antes - 1:+.0%})")
+        sys.exit(1)
+    print("\nsem regressões")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Confere o parser de produtos contra o corpus de referência e mede a vazão.
+
+Uso:
+    python benchmarks/bench_parser.py              # confere os arquivos .json e mede
+    python benchmarks/bench_parser.py --atualizar  # regrava os .json esperados
+
+Cada `corpus/*.txt` é o texto de uma nota como sai do PyMuPDF; o caractere "\\f" separa
+as páginas. O `.json` de mesmo nome guarda as tuplas `(nome, medida, preco)` esperadas.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from orcamento.parser_produtos import ParserProdutos, montar_produto  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# Implementação anterior (regex única com quantificadores preguiçosos e re.DOTALL),
+# mantida aqui só como referência de desempenho.
+_PADRAO_LEGADO = r"\d+\s+(.+?)\s+([\w\s\/]+)\s+(?:De\s+(\d{1,3}(?:\.\d{3})*,\d{2})\s+Por\s+(\d{1,3}(?:\.\d{3})*,\d{2})|(\d{1,3}(?:\.\d{3})*,\d{2}))\s+\d+\s+(\d{1,3}(?:\.\d{3})*,\d{2})"
+
+
+def _remover_medidas_legado(texto):
+    padrao_medida = r'\s*\d+\s*(?:CM|M)?(?:\s*X\s*\d+\s*(?:CM|M)?)?'
+    return re.sub(padrao_medida, '', texto, flags=re.IGNORECASE).strip()
+
+
+def extrair_legado(texto):
+    produtos = []
+    for desc, grade_cor, preco_de, preco_por, preco_normal, total in re.findall(_PADRAO_LEGADO, texto, re.DOTALL):
+        desc = ' '.join(desc.split())
+        grade_cor = ' '.join(grade_cor.split())
+        if any(palavra in desc.lower() for palavra in ["nota", "endereço", "telefones", "horários"]):
+            continue
+        if desc.count('-') >= 2:
+            desc = desc.split('-', 2)[2].strip()
+        elif '-' in desc:
+            desc = desc.split('-', 1)[1].strip()
+        elif '#' in desc:
+            desc = desc.split('#', 1)[1].strip()
+        else:
+            desc = re.sub(r"^\d+\s+", "", desc)
+        desc_limpa = _remover_medidas_legado(desc)
+        _remover_medidas_legado(grade_cor)  # resultado não era usado, mas o custo existia
+        medida = ""
+        match = re.search(r'\d+\s*(?:CM|M)?(?:\s*X\s*\d+\s*(?:CM|M)?)?', grade_cor, re.IGNORECASE)
+        if match:
+            medida = match.group(0).strip()
+        preco = f"De R$ {preco_de} Por R$ {preco_por}" if preco_por else f"R$ {preco_normal}"
+        produtos.append((desc_limpa, medida, preco))
+    return produtos
+
+
+def extrair_novo(paginas):
+    parser = ParserProdutos()
+    produtos = []
+    for texto in paginas:
+        for linha in parser.alimentar(texto):
+            produto = montar_produto(linha)
+            if produto:
+                produtos.append(produto)
+    return produtos
+
+
+def conferir_corpus(atualizar=False):
+    falhas = 0
+    for nome in sorted(os.listdir(CORPUS)):
+        if not nome.endswith(".txt"):
+            continue
+        with open(os.path.join(CORPUS, nome), encoding="utf-8") as f:
+            paginas = f.read().split("\f")
+        obtido = [list(p) for p in extrair_novo(paginas)]
+        caminho_json = os.path.join(CORPUS, nome[:-4] + ".json")
+        if atualizar:
+            with open(caminho_json, "w", encoding="utf-8") as f:
+                json.dump(obtido, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            print(f"atualizado  {nome}: {len(obtido)} produtos")
+            continue
+        with open(caminho_json, encoding="utf-8") as f:
+            esperado = json.load(f)
+        if obtido == esperado:
+            print(f"ok          {nome}: {len(obtido)} produtos")
+        else:
+            falhas += 1
+            print(f"DIVERGENTE  {nome}")
+            for a, b in zip(esperado + [None] * len(obtido), obtido + [None] * len(esperado)):
+                if a != b:
+                    print(f"  esperado {a}\n  obtido   {b}")
+                    break
+    return falhas
+
+
+def _texto_sintetico(n_produtos):
+    partes = []
+    for i in range(1, n_produtos + 1):
+        if i % 3 == 0:
+            preco = f"De\n1.{i % 1000:03d},90\nPor\n{i % 900 + 10},90"
+        else:
+            preco = f"{i % 900 + 10},90"
+        partes.append(f"{i}\n{100000 + i} - LENÇOL C/ELÁST. CASAL {i}\n200X250 BRANCO\n{preco}\n2\n{i % 900 + 20},80")
+    return "\n".join(partes) + "\n"
+
+
+def _linhas_por_segundo(funcao, texto, repeticoes):
+    linhas = texto.count("\n") * repeticoes
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao(texto)
+    return linhas / (time.perf_counter() - inicio)
+
+
+def medir(repeticoes):
+    casos = [
+        ("nota com 5.000 produtos", _texto_sintetico(5000)),
+        # Código de item seguido de muito texto sem preço: força o retrocesso da regex antiga.
+        ("entrada malformada", "1 " + "LENCOL BRANCO 200X250 - \n" * 400 + "9,90 1\n"),
+    ]
+    print(f"\n{'caso':<28}{'legado (linhas/s)':>20}{'novo (linhas/s)':>20}{'ganho':>8}")
+    for nome, texto in casos:
+        legado = _linhas_por_segundo(extrair_legado, texto, repeticoes)
+        novo = _linhas_por_segundo(lambda t: extrair_novo([t]), texto, repeticoes)
+        print(f"{nome:<28}{legado:>20,.0f}{novo:>20,.0f}{novo / legado:>7.1f}x")
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argumentos.add_argument("--atualizar", action="store_true", help="regrava os resultados esperados")
+    argumentos.add_argument("--repeticoes", type=int, default=3)
+    opcoes = argumentos.parse_args()
+    falhas = conferir_corpus(opcoes.atualizar)
+    if not opcoes.atualizar:
+        medir(opcoes.repeticoes)
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Servidor HTTP local que imita a loja, para medir a busca de produtos sem rede.
+
+Rotas servidas a partir de `fixtures/loja/`:
+
+    /s?q=<skuId>               busca com o ld+json do produto (vazia se o skuId começar com "0")
+    /<slug>/p?skuId=<skuId>    página do produto; skuIds pares têm preço "De ... Por"
+
+Uso:
+    with servidor_loja() as servidor:
+        loja.URL_LOJA = servidor.url
+        ...
+        servidor.requisicoes, servidor.bytes_enviados
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "loja")
+
+
+def _modelo(nome):
+    with open(os.path.join(FIXTURES, nome), encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def produto_esperado(sku):
+    """Tupla `(nome, medida, preco)` que `buscar_produto_por_id` deve devolver para o skuId."""
+    nome = f"JOGO DE LENÇOL {sku}"
+    grade = "CASAL 200X250 BRANCO"
+    preco = f"R$ {int(sku) % 900 + 100},90"
+    if int(sku) % 2 == 0:
+        return nome, grade, f"De R$ {int(sku) % 900 + 200},90  Por {preco}"
+    return nome, grade, preco
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        sku = parse_qs(partes.query).get("skuId" if partes.path.endswith("/p") else "q", [""])[0]
+        if not sku.isdigit():
+            self._responder(404, b"nao encontrado")
+            return
+        base = self.server.url
+        nome, grade, preco = produto_esperado(sku)
+        if partes.path == "/s":
+            produtos = [] if sku.startswith("0") else [{
+                "@type": "Product",
+                "alternateName": f"{nome} - {grade}",
+                "url": f"{base}/jogo-de-lencol-{sku}/p?idsku={sku}",
+                "offers": {"offers": [{"price": float(preco.rsplit("R$ ", 1)[1].replace(",", "."))}]},
+            }]
+            ld_json = json.dumps({"@context": "https://schema.org", "products": produtos}, ensure_ascii=False)
+            corpo = self.server.busca.safe_substitute(base=base, sku=sku, nome=nome, ld_json=ld_json)
+        elif partes.path.endswith("/p"):
+            de, _, por = preco.partition("  Por ")
+            if por:
+                html_preco = (
+                    f'          <span class="text-xs text-neutral-500 line-through uppercase">{de.replace(" ", "&nbsp;", 1)}</span>\n'
+                    f'          <span class="text-xl font-bold text-primary">{por.replace(" ", "&nbsp;")}</span>'
+                )
+            else:
+                html_preco = f'          <span class="text-xl font-bold text-primary">{de.replace(" ", "&nbsp;")}</span>'
+            corpo = self.server.produto.safe_substitute(base=base, sku=sku, nome=nome, grade=grade, preco=html_preco)
+        else:
+            self._responder(404, b"nao encontrado")
+            return
+        self._responder(200, corpo.encode("utf-8"))
+
+    def _responder(self, status, corpo):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+        with self.server.trava:
+            self.server.requisicoes += 1
+            self.server.bytes_enviados += len(corpo)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+@contextmanager
+def servidor_loja():
+    """Sobe o servidor em uma porta livre de 127.0.0.1 e o encerra ao sair do bloco."""
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Manipulador)
+    servidor.daemon_threads = True
+    servidor.url = f"http://127.0.0.1:{servidor.server_address[1]}"
+    servidor.busca = _modelo("busca.html")
+    servidor.produto = _modelo("produto.html")
+    servidor.trava = threading.Lock()
+    servidor.requisicoes = 0
+    servidor.bytes_enviados = 0
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield servidor
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
@@ -0,0 +1,22 @@
+"""Extração, busca e geração de PDFs de orçamento, sem depender do Streamlit."""
+from .diagnostico import ESTATISTICAS, configurar_logging, cronometrar
+from .extracao_pdf import extrair_informacoes, extrair_produtos_por_pagina
+from .layout_pdf import calcular_layout, estimar_paginas, gerar_pdf
+from .loja import buscar_produto_por_id, buscar_produto_por_url, buscar_produtos_por_ids
+from .renderizacao import FORMATOS_PAGINA, gerar_pdf_em_cache
+
+__all__ = [
+    "ESTATISTICAS",
+    "FORMATOS_PAGINA",
+    "buscar_produto_por_id",
+    "buscar_produto_por_url",
+    "buscar_produtos_por_ids",
+    "calcular_layout",
+    "configurar_logging",
+    "cronometrar",
+    "estimar_paginas",
+    "extrair_informacoes",
+    "extrair_produtos_por_pagina",
+    "gerar_pdf",
+    "gerar_pdf_em_cache",
+]
@@ -0,0 +1,110 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from cachetools import TTLCache
+
+CACHE_TTL_SEGUNDOS = float(os.environ.get("ORCAMENTO_CACHE_TTL", 6 * 60 * 60))
+CACHE_MAX_MEMORIA = int(os.environ.get("ORCAMENTO_CACHE_MAX_MEMORIA", 2048))
+CACHE_MAX_DISCO = int(os.environ.get("ORCAMENTO_CACHE_MAX_DISCO", 50000))
+CACHE_CAMINHO = os.environ.get(
+    "ORCAMENTO_CACHE_CAMINHO",
+    os.path.join(os.path.expanduser("~"), ".cache", "orcamento_pdf", "produtos.sqlite3"),
+)
+
+
+class CacheProdutos:
+    """Cache de produtos em dois níveis: LRU em memória com TTL e SQLite em disco.
+
+    Os valores guardados são as tuplas `(nome, grade, preco)` já extraídas da loja,
+    indexadas por chaves como "sku:<skuId>" ou "url:<url>". A memória guarda junto o
+    instante da gravação, para que uma entrada trazida do disco não ganhe um TTL novo.
+    """
+
+    def __init__(self, caminho=CACHE_CAMINHO, ttl=CACHE_TTL_SEGUNDOS,
+                 max_memoria=CACHE_MAX_MEMORIA, max_disco=CACHE_MAX_DISCO):
+        self.ttl = ttl
+        self.max_disco = max_disco
+        self._memoria = TTLCache(maxsize=max_memoria, ttl=ttl)
+        self._lock = threading.Lock()
+        self._gravacoes = 0
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS produtos ("
+            "chave TEXT PRIMARY KEY, valor TEXT NOT NULL, gravado_em REAL NOT NULL)"
+        )
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_gravado_em ON produtos (gravado_em)")
+        self._conexao.commit()
+
+    def obter(self, chave):
+        """Devolve o produto guardado em `chave`, ou None se ausente ou expirado."""
+        with self._lock:
+            em_memoria = self._memoria.get(chave)
+            if em_memoria is not None:
+                valor, gravado_em = em_memoria
+                if time.time() - gravado_em < self.ttl:
+                    self.acertos_memoria += 1
+                    return valor
+                del self._memoria[chave]
+            linha = self._conexao.execute(
+                "SELECT valor, gravado_em FROM produtos WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha and time.time() - linha[1] < self.ttl:
+                valor = tuple(json.loads(linha[0]))
+                self._memoria[chave] = (valor, linha[1])
+                self.acertos_disco += 1
+                return valor
+            self.faltas += 1
+            return None
+
+    def guardar(self, chave, valor):
+        with self._lock:
+            gravado_em = time.time()
+            self._memoria[chave] = (tuple(valor), gravado_em)
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO produtos (chave, valor, gravado_em) VALUES (?, ?, ?)",
+                (chave, json.dumps(list(valor), ensure_ascii=False), gravado_em),
+            )
+            self._gravacoes += 1
+            if self._gravacoes % 100 == 0:
+                self._podar()
+            self._conexao.commit()
+
+    def remover(self, chave):
+        with self._lock:
+            self._memoria.pop(chave, None)
+            self._conexao.execute("DELETE FROM produtos WHERE chave = ?", (chave,))
+            self._conexao.commit()
+
+    def limpar(self):
+        with self._lock:
+            self._memoria.clear()
+            self._conexao.execute("DELETE FROM produtos")
+            self._conexao.commit()
+
+    def _podar(self):
+        """Remove entradas expiradas e mantém no disco apenas as `max_disco` mais recentes."""
+        self._conexao.execute("DELETE FROM produtos WHERE gravado_em < ?", (time.time() - self.ttl,))
+        self._conexao.execute(
+            "DELETE FROM produtos WHERE chave NOT IN "
+            "(SELECT chave FROM produtos ORDER BY gravado_em DESC LIMIT ?)",
+            (self.max_disco,),
+        )
+
+    def estatisticas(self):
+        acertos = self.acertos_memoria + self.acertos_disco
+        consultas = acertos + self.faltas
+        return {
+            "acertos_memoria": self.acertos_memoria,
+            "acertos_disco": self.acertos_disco,
+            "faltas": self.faltas,
+            "taxa_acerto": acertos / consultas if consultas else 0.0,
+            "itens_memoria": len(self._memoria),
+        }
@@ -0,0 +1,247 @@
+"""Gera vários orçamentos em lote, sem a interface do Streamlit.
+
+Uso:
+    python -m orcamento manifesto.json --saida pdfs/ --processos 4 --relatorio relatorio.json
+
+O manifesto é um JSON (lista de trabalhos, ou `{"trabalhos": [...]}`) ou um CSV com uma
+linha por trabalho. Campos de cada trabalho:
+
+    saida           nome do PDF gerado (padrão: orcamento_001.pdf, ...)
+    titulo_grande   / titulo_pequeno
+    formato         chave de FORMATOS_PAGINA (padrão: A4)
+    colunas         colunas por página (padrão: 1)
+    sku_ids         skuIds a buscar na loja (lista, ou texto separado por vírgula/;/espaço)
+    pdfs            PDFs de fornecedor a extrair (lista, ou texto separado por ";")
+    produtos        tuplas (nome, medida, preco) já prontas (só no JSON)
+
+Caminhos relativos de `pdfs` são resolvidos a partir da pasta do manifesto. No CSV, use
+aspas no formato, já que as chaves contêm vírgula (ex.: "A5 (14,8 x 21 cm)").
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from io import BytesIO
+
+from .diagnostico import Estatisticas, coletando, configurar_logging
+from .extracao_pdf import extrair_produtos_por_pagina
+from .layout_pdf import gerar_pdf
+from .loja import buscar_produtos_por_ids, ler_sku_ids
+from .renderizacao import (
+    ALTURA_LOGO_PADRAO_CM,
+    FORMATOS_PAGINA,
+    MARGENS_PADRAO,
+    TITULO_GRANDE_PADRAO,
+    TITULO_PEQUENO_PADRAO,
+    logo_rodape,
+)
+
+FORMATO_PADRAO = next(iter(FORMATOS_PAGINA))
+
+
+def _lista(valor, separadores=None):
+    if not valor:
+        return []
+    if isinstance(valor, str):
+        if separadores:
+            return [item.strip() for item in valor.split(separadores) if item.strip()]
+        return ler_sku_ids(valor)
+    return [str(item) for item in valor]
+
+
+def _produto(valor):
+    if isinstance(valor, str) or len(valor) != 3:
+        raise ValueError(f"produto deve ter nome, medida e preço: {valor!r}")
+    return tuple(str(campo) for campo in valor)
+
+
+def _normalizar_trabalho(bruto, i, pasta):
+    return {
+        "saida": bruto.get("saida") or f"orcamento_{i:03d}.pdf",
+        "titulo_grande": bruto.get("titulo_grande") or TITULO_GRANDE_PADRAO,
+        "titulo_pequeno": bruto.get("titulo_pequeno") or TITULO_PEQUENO_PADRAO,
+        "formato": bruto.get("formato") or FORMATO_PADRAO,
+        "colunas": int(bruto.get("colunas") or 1),
+        "sku_ids": _lista(bruto.get("sku_ids")),
+        "pdfs": [os.path.join(pasta, p) for p in _lista(bruto.get("pdfs"), ";")],
+        "produtos": [_produto(p) for p in bruto.get("produtos") or []],
+    }
+
+
+def ler_manifesto(caminho):
+    """Lê o manifesto e devolve a lista de trabalhos normalizados."""
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    with open(caminho, encoding="utf-8-sig", newline="") as f:
+        if caminho.lower().endswith(".csv"):
+            brutos = list(csv.DictReader(f))
+        else:
+            brutos = json.load(f)
+    if isinstance(brutos, dict):
+        brutos = brutos.get("trabalhos", [])
+    if not isinstance(brutos, list):
+        raise ValueError("esperada uma lista de trabalhos")
+
+    trabalhos = []
+    for i, bruto in enumerate(brutos, start=1):
+        if not isinstance(bruto, dict):
+            raise ValueError(f"trabalho {i}: esperado um objeto, veio {type(bruto).__name__}")
+        try:
+            trabalhos.append(_normalizar_trabalho(bruto, i, pasta))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"trabalho {i}: {e}") from e
+    return trabalhos
+
+
+def executar_trabalho(trabalho, pasta_saida):
+    """Monta a lista de produtos de um trabalho e grava o PDF. Nunca levanta exceção."""
+    resultado = {
+        "saida": os.path.join(pasta_saida, trabalho["saida"]),
+        "ok": False,
+        "erro": None,
+        "produtos": 0,
+        "nao_encontrados": [],
+        "falhas_busca": {},
+        "paginas": 0,
+        "bytes": 0,
+        "tempos": {},
+        "diagnostico": None,
+    }
+    inicio = time.perf_counter()
+    with coletando(Estatisticas()) as coletor:
+        try:
+            if trabalho["formato"] not in FORMATOS_PAGINA:
+                raise ValueError(f"formato desconhecido: {trabalho['formato']!r}")
+            tamanho_pagina = FORMATOS_PAGINA[trabalho["formato"]]
+            produtos = list(trabalho["produtos"])
+
+            marca = time.perf_counter()
+            for caminho_pdf in trabalho["pdfs"]:
+                # o paralelismo já está entre os trabalhos; aqui as páginas ficam no mesmo processo
+                for pagina in extrair_produtos_por_pagina(caminho_pdf, max_workers=1):
+                    produtos.extend(pagina)
+            resultado["tempos"]["extracao"] = time.perf_counter() - marca
+
+            marca = time.perf_counter()
+            if trabalho["sku_ids"]:
+                falhas = {}
+                encontrados = buscar_produtos_por_ids(trabalho["sku_ids"], falhas=falhas)
+                produtos.extend(p for p in encontrados if p)
+                resultado["nao_encontrados"] = [
+                    sku for sku, p in zip(trabalho["sku_ids"], encontrados) if not p and sku not in falhas
+                ]
+                resultado["falhas_busca"] = {sku: falhas[sku] for sku in trabalho["sku_ids"] if sku in falhas}
+            resultado["tempos"]["busca"] = time.perf_counter() - marca
+            if resultado["falhas_busca"]:
+                # um orçamento sem parte dos produtos não deve passar como gerado
+                raise RuntimeError(f"falha ao buscar {len(resultado['falhas_busca'])} skuId(s) na loja")
+
+            marca = time.perf_counter()
+            buffer = BytesIO()
+            layout = gerar_pdf(produtos, buffer, tamanho_pagina, MARGENS_PADRAO, ALTURA_LOGO_PADRAO_CM,
+                               trabalho["titulo_grande"], trabalho["titulo_pequeno"],
+                               colunas=trabalho["colunas"], logo=logo_rodape())
+            os.makedirs(os.path.dirname(resultado["saida"]) or ".", exist_ok=True)
+            with open(resultado["saida"], "wb") as f:
+                f.write(buffer.getbuffer())
+            resultado["tempos"]["renderizacao"] = time.perf_counter() - marca
+
+            resultado.update(
+                ok=True,
+                produtos=len(produtos),
+                bytes=buffer.getbuffer().nbytes,
+                paginas=len(layout.paginas),
+            )
+        except Exception as e:
+            resultado["erro"] = f"{type(e).__name__}: {e}"
+        resultado["diagnostico"] = coletor.resumo()
+    resultado["tempos"]["total"] = time.perf_counter() - inicio
+    return resultado
+
+
+def executar_lote(trabalhos, pasta_saida, processos=None, ao_concluir=None, nivel_log=None):
+    """Executa os trabalhos em um pool de processos; os resultados saem na ordem do manifesto."""
+    resultados = [None] * len(trabalhos)
+    with ProcessPoolExecutor(max_workers=processos, initializer=configurar_logging, initargs=(nivel_log,)) as executor:
+        futuros = {executor.submit(executar_trabalho, t, pasta_saida): i for i, t in enumerate(trabalhos)}
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            resultados[i] = futuro.result()
+            if ao_concluir:
+                ao_concluir(resultados[i])
+    return resultados
+
+
+def agregar_diagnostico(resultados):
+    """Soma as medições por etapa de todos os trabalhos."""
+    total = Estatisticas()
+    for r in resultados:
+        if r["diagnostico"]:
+            total.mesclar(r["diagnostico"])
+    return total.resumo()
+
+
+def imprimir_etapas(diagnostico, saida=sys.stdout):
+    print(f"\n{'etapa':<24}{'chamadas':>9}{'total':>10}{'média':>10}{'máx.':>10}", file=saida)
+    for etapa, dados in diagnostico["etapas"].items():
+        print(f"{etapa:<24}{dados['chamadas']:>9}{dados['total_s']:>9.2f}s"
+              f"{dados['media_s'] * 1000:>8.1f}ms{dados['max_s'] * 1000:>8.1f}ms", file=saida)
+    contadores = diagnostico["contadores"]
+    if contadores.get("http.requisicoes"):
+        print(f"HTTP: {contadores['http.requisicoes']} requisições, {contadores.get('http.bytes', 0) / 1024:.0f} KB",
+              file=saida)
+
+
+def imprimir_resumo(resultados, duracao, saida=sys.stdout):
+    falhas = [r for r in resultados if not r["ok"]]
+    print(f"\n{'PDF':<40}{'produtos':>9}{'páginas':>9}{'KB':>8}{'busca':>8}{'extr.':>8}{'render':>8}{'total':>8}", file=saida)
+    for r in resultados:
+        nome = os.path.basename(r["saida"])
+        if r["ok"]:
+            t = r["tempos"]
+            print(f"{nome:<40}{r['produtos']:>9}{r['paginas']:>9}{r['bytes'] / 1024:>8.0f}"
+                  f"{t['busca']:>7.2f}s{t['extracao']:>7.2f}s{t['renderizacao']:>7.2f}s{t['total']:>7.2f}s", file=saida)
+        else:
+            print(f"{nome:<40}  FALHOU: {r['erro']}", file=saida)
+        if r["nao_encontrados"]:
+            print(f"{'':<4}skuIds não encontrados: {', '.join(r['nao_encontrados'])}", file=saida)
+        for sku, erro in r["falhas_busca"].items():
+            print(f"{'':<4}skuId {sku}: {erro}", file=saida)
+    print(f"\n{len(resultados) - len(falhas)} de {len(resultados)} orçamentos gerados em {duracao:.1f}s"
+          + (f", {len(falhas)} com falha" if falhas else ""), file=saida)
+
+
+def main(argv=None):
+    argumentos = argparse.ArgumentParser(prog="python -m orcamento", description=__doc__.splitlines()[0])
+    argumentos.add_argument("manifesto", help="arquivo .json ou .csv com os trabalhos")
+    argumentos.add_argument("--saida", default=".", help="pasta onde gravar os PDFs (padrão: atual)")
+    argumentos.add_argument("--processos", type=int, default=None, help="tamanho do pool (padrão: nº de CPUs)")
+    argumentos.add_argument("--relatorio", help="grava o resumo detalhado em JSON neste caminho")
+    argumentos.add_argument("--log-nivel", help="DEBUG, INFO, WARNING... (padrão: ORCAMENTO_LOG_NIVEL ou WARNING)")
+    opcoes = argumentos.parse_args(argv)
+    configurar_logging(opcoes.log_nivel)
+
+    try:
+        trabalhos = ler_manifesto(opcoes.manifesto)
+    except (OSError, ValueError) as e:
+        argumentos.error(f"manifesto inválido: {e}")
+    inicio = time.perf_counter()
+    feitos = []
+
+    def _progresso(resultado):
+        feitos.append(resultado)
+        estado = "ok" if resultado["ok"] else "FALHOU"
+        print(f"[{len(feitos)}/{len(trabalhos)}] {estado:<6} {resultado['saida']}", file=sys.stderr)
+
+    resultados = executar_lote(trabalhos, opcoes.saida, opcoes.processos, _progresso, opcoes.log_nivel)
+    duracao = time.perf_counter() - inicio
+    diagnostico = agregar_diagnostico(resultados)
+    imprimir_resumo(resultados, duracao)
+    imprimir_etapas(diagnostico)
+    if opcoes.relatorio:
+        with open(opcoes.relatorio, "w", encoding="utf-8") as f:
+            json.dump({"duracao": duracao, "diagnostico": diagnostico, "trabalhos": resultados}, f,
+                      ensure_ascii=False, indent=2)
+    sys.exit(1 if any(not r["ok"] for r in resultados) else 0)
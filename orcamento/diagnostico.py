@@ -0,0 +1,175 @@
+"""Cronômetros por etapa, contadores e logging estruturado do pacote.
+
+    with cronometrar("loja.http", url=url):
+        ...
+    contar("http.bytes", len(conteudo))
+
+Toda medição vai para `ESTATISTICAS` (o processo inteiro) e, se houver, para o coletor
+ativado com `usar_coletor` no contexto atual; o app usa isso para separar os números de
+cada sessão. O nível de log vem de ORCAMENTO_LOG_NIVEL (padrão WARNING) e o formato de
+ORCAMENTO_LOG_FORMATO (`texto` ou `json`).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+LOG_NIVEL = os.environ.get("ORCAMENTO_LOG_NIVEL", "WARNING").upper()
+LOG_FORMATO = os.environ.get("ORCAMENTO_LOG_FORMATO", "texto").lower()
+
+
+class Estatisticas:
+    """Acumula chamadas e durações por etapa, além de contadores livres. Segura entre threads."""
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self.limpar()
+
+    def limpar(self):
+        with self._trava:
+            self._etapas = {}  # etapa -> [chamadas, total_s, max_s]
+            self._contadores = Counter()
+            self.desde = time.time()
+
+    def registrar(self, etapa, duracao):
+        with self._trava:
+            acumulado = self._etapas.setdefault(etapa, [0, 0.0, 0.0])
+            acumulado[0] += 1
+            acumulado[1] += duracao
+            acumulado[2] = max(acumulado[2], duracao)
+
+    def contar(self, nome, valor=1):
+        with self._trava:
+            self._contadores[nome] += valor
+
+    def mesclar(self, resumo):
+        """Soma um `resumo()` de outro coletor (por exemplo, vindo de um processo filho)."""
+        with self._trava:
+            for etapa, dados in resumo.get("etapas", {}).items():
+                acumulado = self._etapas.setdefault(etapa, [0, 0.0, 0.0])
+                acumulado[0] += dados["chamadas"]
+                acumulado[1] += dados["total_s"]
+                acumulado[2] = max(acumulado[2], dados["max_s"])
+            self._contadores.update(resumo.get("contadores", {}))
+
+    def resumo(self):
+        """Dicionário serializável em JSON com os números acumulados."""
+        with self._trava:
+            etapas = {
+                etapa: {
+                    "chamadas": chamadas,
+                    "total_s": round(total, 6),
+                    "media_s": round(total / chamadas, 6) if chamadas else 0.0,
+                    "max_s": round(maximo, 6),
+                }
+                for etapa, (chamadas, total, maximo) in sorted(self._etapas.items())
+            }
+            contadores = dict(sorted(self._contadores.items()))
+        return {"desde": self.desde, "etapas": etapas, "contadores": contadores}
+
+
+ESTATISTICAS = Estatisticas()
+_coletor = ContextVar("coletor_orcamento", default=None)
+
+
+def usar_coletor(estatisticas):
+    """Direciona as medições do contexto atual também para `estatisticas` (None desativa)."""
+    _coletor.set(estatisticas)
+
+
+@contextmanager
+def coletando(estatisticas):
+    """Como `usar_coletor`, mas só dentro do bloco."""
+    token = _coletor.set(estatisticas)
+    try:
+        yield estatisticas
+    finally:
+        _coletor.reset(token)
+
+
+def _destinos():
+    coletor = _coletor.get()
+    return (ESTATISTICAS,) if coletor is None else (ESTATISTICAS, coletor)
+
+
+def registrar(etapa, duracao):
+    for destino in _destinos():
+        destino.registrar(etapa, duracao)
+
+
+def contar(nome, valor=1):
+    for destino in _destinos():
+        destino.contar(nome, valor)
+
+
+@contextmanager
+def cronometrar(etapa, **campos):
+    """Mede o bloco (ou a função decorada) como uma chamada de `etapa`."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        duracao = time.perf_counter() - inicio
+        registrar(etapa, duracao)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("etapa concluída", extra=campos_log(etapa=etapa, duracao_ms=round(duracao * 1000, 3), **campos))
+
+
+def taxa_acerto(contadores, prefixo):
+    """Fração de acertos de `<prefixo>.acertos` sobre `<prefixo>.acertos` + `<prefixo>.faltas`."""
+    acertos = contadores.get(f"{prefixo}.acertos", 0)
+    consultas = acertos + contadores.get(f"{prefixo}.faltas", 0)
+    return acertos / consultas if consultas else 0.0
+
+
+def campos_log(**campos):
+    """Campos estruturados de um evento: `logger.warning("...", extra=campos_log(url=url))`."""
+    return {"campos": campos}
+
+
+def _valor_texto(valor):
+    if isinstance(valor, str) and (not valor or any(c.isspace() or c in '"=' for c in valor)):
+        return json.dumps(valor, ensure_ascii=False)
+    return valor
+
+
+class FormatadorEstruturado(logging.Formatter):
+    """Uma linha por evento, em JSON ou como `chave=valor` depois da mensagem."""
+
+    def __init__(self, formato="texto"):
+        super().__init__()
+        self.formato = formato
+
+    def format(self, record):
+        dados = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            **getattr(record, "campos", {}),
+        }
+        if record.exc_info:
+            dados["excecao"] = self.formatException(record.exc_info)
+        if self.formato == "json":
+            return json.dumps(dados, ensure_ascii=False, default=str)
+        pares = (f"{chave}={_valor_texto(valor)}" for chave, valor in list(dados.items())[4:])
+        return " ".join([dados["ts"], dados["nivel"], dados["logger"], dados["msg"], *pares])
+
+
+def configurar_logging(nivel=None, formato=None):
+    """Liga o handler do logger `orcamento`; pode ser chamada de novo para trocar nível ou formato."""
+    raiz = logging.getLogger("orcamento")
+    handler = next((h for h in raiz.handlers if isinstance(h.formatter, FormatadorEstruturado)), None)
+    if handler is None:
+        handler = logging.StreamHandler()
+        raiz.addHandler(handler)
+    handler.setFormatter(FormatadorEstruturado(formato or LOG_FORMATO))
+    raiz.setLevel((nivel or LOG_NIVEL).upper())
+    raiz.propagate = False
+    return raiz
@@ -0,0 +1,45 @@
+"""Aplica as alterações do editor de tabela à lista de produtos `(nome, medida, preco)`.
+
+O `st.data_editor` guarda em `st.session_state[chave]` apenas a diferença em relação à
+tabela de origem (`edited_rows`, `added_rows`, `deleted_rows`), indexada pela posição na
+tabela exibida. Como a tabela pode ser um recorte filtrado da lista, `indices` traduz cada
+posição exibida para a posição na lista completa.
+"""
+COLUNAS = ("nome", "medida", "preco")
+
+
+def filtrar_indices(produtos, filtro):
+    """Posições dos produtos cujo nome, medida ou preço contém o texto do filtro."""
+    filtro = filtro.strip().lower()
+    if not filtro:
+        return list(range(len(produtos)))
+    return [i for i, produto in enumerate(produtos) if filtro in " ".join(produto).lower()]
+
+
+def _texto(valor):
+    return "" if valor is None else str(valor)
+
+
+def aplicar_edicoes(produtos, indices, edicoes):
+    """Devolve uma nova lista de tuplas com as edições, exclusões e inclusões aplicadas."""
+    if not edicoes or not any(edicoes.get(k) for k in ("edited_rows", "added_rows", "deleted_rows")):
+        return list(produtos)
+
+    alterados = {}
+    for posicao, mudancas in edicoes.get("edited_rows", {}).items():
+        i = indices[int(posicao)]
+        linha = list(alterados.get(i, produtos[i]))
+        for coluna, valor in mudancas.items():
+            if coluna in COLUNAS:
+                linha[COLUNAS.index(coluna)] = _texto(valor)
+        alterados[i] = tuple(linha)
+
+    removidos = {indices[int(posicao)] for posicao in edicoes.get("deleted_rows", [])}
+    resultado = [
+        alterados.get(i, produto) for i, produto in enumerate(produtos) if i not in removidos
+    ]
+    resultado.extend(
+        tuple(_texto(nova.get(coluna)) for coluna in COLUNAS)
+        for nova in edicoes.get("added_rows", [])
+    )
+    return resultado
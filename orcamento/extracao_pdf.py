@@ -0,0 +1,99 @@
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+
+from .diagnostico import cronometrar, registrar
+from .parser_produtos import ParserProdutos, montar_produto
+
+# A partir de quantas páginas a extração de texto é distribuída entre processos. Abrir
+# processos novos (forkserver/spawn) custa algumas centenas de ms, o que só se paga em
+# documentos grandes.
+PAGINAS_PARA_PROCESSOS = 500
+
+_documento_processo = None  # documento aberto uma vez em cada processo do pool
+
+
+def _abrir_documento(origem):
+    """Abre um PDF a partir de um caminho ou direto dos bytes em memória."""
+    if isinstance(origem, (bytes, bytearray, memoryview)):
+        return fitz.open(stream=bytes(origem), filetype="pdf")
+    return fitz.open(origem)
+
+def contar_paginas(origem):
+    with _abrir_documento(origem) as doc:
+        return doc.page_count
+
+def _iniciar_processo(origem):
+    global _documento_processo
+    _documento_processo = _abrir_documento(origem)
+
+def _extrair_textos(inicio, fim):
+    """Roda no processo filho; devolve os textos e o tempo de cada página, que é registrado no pai."""
+    textos, duracoes = [], []
+    for i in range(inicio, fim):
+        pagina = _documento_processo[i]
+        marca = time.perf_counter()
+        textos.append(pagina.get_text())
+        duracoes.append(time.perf_counter() - marca)
+    return textos, duracoes
+
+def _contexto_processos():
+    # processos novos, e não cópias via fork do servidor do Streamlit com suas threads
+    metodos = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in metodos else "spawn")
+
+def textos_das_paginas(origem, max_workers=None):
+    """Gera o texto de cada página, em ordem.
+
+    Documentos grandes têm a extração distribuída por um pool de processos: cada processo
+    recebe o PDF uma única vez e as tarefas levam só o intervalo de páginas. Os lotes
+    continuam sendo entregues na ordem original.
+    """
+    processos = max_workers or os.cpu_count() or 1
+    with _abrir_documento(origem) as doc:
+        total = doc.page_count
+        if total < PAGINAS_PARA_PROCESSOS or processos == 1:
+            for page in doc:
+                with cronometrar("extracao.texto"):
+                    texto = page.get_text()
+                yield texto
+            return
+    if isinstance(origem, memoryview):
+        origem = bytes(origem)  # memoryview não pode ser enviado aos processos
+    tamanho_lote = math.ceil(total / processos)
+    inicios = range(0, total, tamanho_lote)
+    with ProcessPoolExecutor(
+        max_workers=len(inicios),
+        mp_context=_contexto_processos(),
+        initializer=_iniciar_processo,
+        initargs=(origem,),
+    ) as executor:
+        resultados = executor.map(
+            _extrair_textos,
+            inicios,
+            [min(inicio + tamanho_lote, total) for inicio in inicios],
+        )
+        for textos, duracoes in resultados:
+            for texto, duracao in zip(textos, duracoes):
+                registrar("extracao.texto", duracao)
+                yield texto
+
+def extrair_produtos_por_pagina(origem, max_workers=None):
+    """Gera, para cada página, a lista de produtos encontrados nela.
+
+    O mesmo `ParserProdutos` é usado em todas as páginas, então um produto dividido entre
+    duas páginas é reconhecido na segunda.
+    """
+    parser = ParserProdutos()
+    for texto in textos_das_paginas(origem, max_workers):
+        with cronometrar("extracao.parser"):
+            produtos = [produto for produto in map(montar_produto, parser.alimentar(texto)) if produto]
+        yield produtos
+
+def extrair_informacoes(origem):
+    """Extrai todos os produtos de um PDF (caminho ou bytes)."""
+    return [produto for pagina in extrair_produtos_por_pagina(origem) for produto in pagina]
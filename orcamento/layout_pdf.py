@@ -0,0 +1,181 @@
+from collections import namedtuple
+
+from reportlab.lib import colors
+from reportlab.lib.units import cm
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
+
+from .diagnostico import cronometrar
+
+FONTE = "Helvetica"
+FONTE_NEGRITO = "Helvetica-Bold"
+TAMANHO_TEXTO = 12
+TAMANHO_MINIMO = 9          # textos longos encolhem até aqui antes de quebrar em linhas
+MAX_LINHAS = 3              # por texto (nome, medida ou preço)
+ENTRELINHA = 0.6 * cm
+ESPACO_ENTRE_BLOCOS = 0.9 * cm
+ESPACO_ENTRE_COLUNAS = 0.5 * cm
+ESPACO_ACIMA_RODAPE = 0.5 * cm
+# Título grande + título pequeno + espaço até o primeiro produto, como no layout original.
+ALTURA_CABECALHO = 0.6 * cm + 2 * cm
+
+Bloco = namedtuple("Bloco", "linhas_nome tamanho_nome linhas_medida tamanho_medida linhas_preco tamanho_preco altura")
+Layout = namedtuple("Layout", "paginas tamanho_pagina margens altura_logo_cm colunas")
+
+
+def _tamanho_que_cabe(texto, fonte, largura):
+    largura_texto = stringWidth(texto, fonte, TAMANHO_TEXTO)
+    if largura_texto <= largura:
+        return TAMANHO_TEXTO
+    return TAMANHO_TEXTO * largura / largura_texto
+
+
+def _partir_linha(linha, fonte, tamanho, largura):
+    """Quebra, letra a letra, uma linha que não cabe na largura (uma palavra longa demais)."""
+    pedacos, atual, largura_atual = [], "", 0.0
+    for letra in linha:
+        largura_letra = stringWidth(letra, fonte, tamanho)
+        if atual and largura_atual + largura_letra > largura:
+            pedacos.append(atual)
+            atual, largura_atual = "", 0.0
+        atual += letra
+        largura_atual += largura_letra
+    return pedacos + [atual]
+
+
+def _medir_texto(texto, fonte, largura):
+    """Encolhe o texto até caber na coluna; se ainda assim não couber, quebra em linhas."""
+    tamanho = _tamanho_que_cabe(texto, fonte, largura)
+    if tamanho >= TAMANHO_MINIMO:
+        return [texto], tamanho
+    tamanho = TAMANHO_MINIMO
+    # simpleSplit só quebra nos espaços; palavras mais largas que a coluna são partidas aqui
+    linhas = [
+        pedaco
+        for linha in simpleSplit(texto, fonte, tamanho, largura)
+        for pedaco in (
+            _partir_linha(linha, fonte, tamanho, largura)
+            if stringWidth(linha, fonte, tamanho) > largura else [linha]
+        )
+    ]
+    if len(linhas) > MAX_LINHAS:
+        linhas = linhas[:MAX_LINHAS]
+        ultima = linhas[-1]
+        while ultima and stringWidth(ultima + "…", fonte, tamanho) > largura:
+            ultima = ultima[:-1]
+        linhas[-1] = ultima.rstrip() + "…"
+    return linhas, tamanho
+
+
+def _montar_bloco(produto, largura):
+    nome, medida, preco = produto
+    linhas_nome, tamanho_nome = _medir_texto(nome, FONTE, largura)
+    linhas_medida, tamanho_medida = _medir_texto(medida, FONTE, largura)
+    linhas_preco, tamanho_preco = _medir_texto(preco, FONTE_NEGRITO, largura)
+    # nome, medida e preço, cada um com suas linhas, depois o espaço até o próximo bloco
+    altura = (len(linhas_nome) + len(linhas_medida) + len(linhas_preco)) * ENTRELINHA + ESPACO_ENTRE_BLOCOS
+    return Bloco(
+        linhas_nome, tamanho_nome,
+        linhas_medida, tamanho_medida,
+        linhas_preco, tamanho_preco,
+        altura,
+    )
+
+
+def calcular_layout(produtos, tamanho_pagina, margens, altura_logo_cm, colunas=1):
+    """Distribui os produtos em uma grade de `colunas` colunas, página a página.
+
+    `margens` é `(topo, base, lateral)` em cm e `altura_logo_cm` é a altura do logo do
+    rodapé, reservada acima da margem de baixo em todas as páginas. Cada página do
+    resultado é uma lista de `(x_centro, y, Bloco)`, com `y` na linha de base do nome.
+    """
+    largura_pagina, altura_pagina = tamanho_pagina
+    margem_topo, margem_base, margem_lateral = margens
+    colunas = max(1, int(colunas))
+    largura_util = largura_pagina - 2 * margem_lateral * cm
+    largura_coluna = (largura_util - (colunas - 1) * ESPACO_ENTRE_COLUNAS) / colunas
+    centros = [
+        margem_lateral * cm + i * (largura_coluna + ESPACO_ENTRE_COLUNAS) + largura_coluna / 2
+        for i in range(colunas)
+    ]
+    topo = altura_pagina - margem_topo * cm
+    limite = margem_base * cm + altura_logo_cm * cm + ESPACO_ACIMA_RODAPE
+
+    paginas = [[]]
+    y = topo - ALTURA_CABECALHO
+    for inicio in range(0, len(produtos), colunas):
+        linha = [_montar_bloco(p, largura_coluna) for p in produtos[inicio:inicio + colunas]]
+        altura_linha = max(bloco.altura for bloco in linha)
+        # a última linha de texto do bloco mais alto precisa ficar acima do rodapé
+        if y - (altura_linha - ESPACO_ENTRE_BLOCOS - ENTRELINHA) < limite and paginas[-1]:
+            paginas.append([])
+            y = topo
+        paginas[-1].extend((centros[i], y, bloco) for i, bloco in enumerate(linha))
+        y -= altura_linha
+    return Layout(paginas, tamanho_pagina, margens, altura_logo_cm, colunas)
+
+
+def estimar_paginas(produtos, tamanho_pagina, margens, altura_logo_cm, colunas=1):
+    """Número de páginas que o PDF terá, sem desenhar nada."""
+    return len(calcular_layout(produtos, tamanho_pagina, margens, altura_logo_cm, colunas).paginas)
+
+
+def _desenhar_rodape(c, layout, logo):
+    if not logo:
+        return
+    imagem, largura_px, altura_px = logo
+    largura_pagina = layout.tamanho_pagina[0]
+    altura = layout.altura_logo_cm * cm
+    largura = min(altura * largura_px / altura_px, largura_pagina - 2 * layout.margens[2] * cm)
+    altura = largura * altura_px / largura_px
+    # O mesmo ImageReader em todas as páginas vira um único XObject no PDF.
+    c.drawImage(imagem, (largura_pagina - largura) / 2, layout.margens[1] * cm, largura, altura, mask='auto')
+
+
+def desenhar_layout(c, layout, titulo_grande, titulo_pequeno, logo=None):
+    largura_pagina, altura_pagina = layout.tamanho_pagina
+    for num_pagina, blocos in enumerate(layout.paginas):
+        if num_pagina == 0:
+            y = altura_pagina - layout.margens[0] * cm
+            c.setFont(FONTE_NEGRITO, 20)
+            c.setFillColor(colors.gold)
+            c.drawCentredString(largura_pagina / 2, y, titulo_grande)
+            c.setFont(FONTE, 10)
+            c.setFillColor(colors.orange)
+            c.drawCentredString(largura_pagina / 2, y - 0.6 * cm, titulo_pequeno)
+
+        for x, y, bloco in blocos:
+            c.setFillColor(colors.black)
+            c.setFont(FONTE, bloco.tamanho_nome)
+            for linha in bloco.linhas_nome:
+                c.drawCentredString(x, y, linha)
+                y -= ENTRELINHA
+            c.setFont(FONTE, bloco.tamanho_medida)
+            for linha in bloco.linhas_medida:
+                c.drawCentredString(x, y, linha)
+                y -= ENTRELINHA
+            c.setFont(FONTE_NEGRITO, bloco.tamanho_preco)
+            c.setFillColor(colors.gold)
+            for linha in bloco.linhas_preco:
+                c.drawCentredString(x, y, linha)
+                y -= ENTRELINHA
+
+        _desenhar_rodape(c, layout, logo)
+        c.showPage()
+
+
+def gerar_pdf(produtos, destino, tamanho_pagina, margens, altura_logo_cm, titulo_grande, titulo_pequeno,
+              colunas=1, logo=None):
+    """Desenha o orçamento em `destino`: um caminho ou um arquivo em memória (BytesIO).
+
+    `logo` é `(ImageReader, largura_px, altura_px)` e é carimbado no rodapé de todas as páginas.
+    Devolve o `Layout` usado, de onde sai o número de páginas sem recalcular nada.
+    """
+    with cronometrar("renderizacao.layout", produtos=len(produtos)):
+        layout = calcular_layout(produtos, tamanho_pagina, margens, altura_logo_cm, colunas)
+    with cronometrar("renderizacao.desenho", paginas=len(layout.paginas)):
+        c = canvas.Canvas(destino, pagesize=tamanho_pagina)
+        desenhar_layout(c, layout, titulo_grande, titulo_pequeno, logo)
+        c.save()
+    return layout
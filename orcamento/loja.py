@@ -0,0 +1,211 @@
+import contextvars
+import csv
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from .cache_produtos import CacheProdutos
+from .diagnostico import campos_log, contar, cronometrar
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = (5, 20)  # (conexão, leitura) em segundos
+HTTP_TENTATIVAS = 3
+BUSCA_MAX_WORKERS = 8
+URL_LOJA = os.environ.get("ORCAMENTO_URL_LOJA", "https://www.mundodoenxoval.com.br").rstrip("/")
+
+@lru_cache(maxsize=None)
+def sessao_http():
+    """Sessão HTTP compartilhada, com keep-alive e pool de conexões."""
+    sessao = requests.Session()
+    adaptador = HTTPAdapter(pool_connections=BUSCA_MAX_WORKERS, pool_maxsize=BUSCA_MAX_WORKERS)
+    sessao.mount("https://", adaptador)
+    sessao.mount("http://", adaptador)
+    return sessao
+
+@lru_cache(maxsize=None)
+def cache_produtos():
+    """Cache de produtos compartilhado por todo o processo (reruns, sessões e usuários)."""
+    return CacheProdutos()
+
+def _erro_temporario(erro):
+    """Falhas de rede e respostas 5xx/429 merecem nova tentativa; 4xx não."""
+    if isinstance(erro, requests.HTTPError):
+        status = erro.response.status_code if erro.response is not None else 0
+        return status == 429 or status >= 500
+    return isinstance(erro, (requests.ConnectionError, requests.Timeout))
+
+@retry(
+    retry=retry_if_exception(_erro_temporario),
+    stop=stop_after_attempt(HTTP_TENTATIVAS),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    reraise=True,
+)
+def baixar_html(url):
+    with cronometrar("loja.http", url=url):
+        resposta = sessao_http().get(url, timeout=HTTP_TIMEOUT)
+    contar("http.requisicoes")
+    contar("http.bytes", len(resposta.content))
+    resposta.raise_for_status()
+    return resposta.content.decode("utf-8")
+
+def _ler_pagina_produto(url_nova):
+    """Baixa e interpreta a página do produto, sem passar pelo cache.
+
+    Devolve None se a página não tiver nome e preço; falhas de rede e HTTP sobem como exceção.
+    """
+    html = baixar_html(url_nova)
+    with cronometrar("loja.html"):
+        soup = BeautifulSoup(html, "html.parser")
+    # Nome do produto
+    h1 = soup.find("h1", class_="w-full text-xl font-bold text-left uppercase text-primary")
+    nome = h1.get_text(strip=True) if h1 else None
+    if nome and '-' in nome:
+        novoNome = nome.split('-', 1)[0].strip()
+        grade = nome.split('-', 1)[1].strip()
+        nome = novoNome
+    else:
+        nome = nome
+        grade = ""
+    # Preço do produto
+    span = soup.find("span", class_="text-xl font-bold text-primary")
+    preco = span.get_text(strip=True).replace(" ", "").replace("\xa0", " ") if span else None
+    span = soup.find("span", class_="text-xs text-neutral-500 line-through uppercase")
+    preco_promocional = span.get_text(strip=True).replace("\xa0", " ") if span else None
+    # Preço do produto
+    span = soup.find("span", class_="text-xl font-bold text-primary")
+    preco = span.get_text(strip=True).replace(" ", "").replace("\xa0", " ") if span else None 
+    if preco_promocional is not None:
+        preco = f"{preco_promocional}  Por {preco}"
+    else:
+        preco = preco
+    if nome and preco:
+        return (nome,grade, preco)
+    return None
+
+def buscar_produto_por_url(url_nova, forcar=False):
+    chave = f"url:{url_nova}"
+    if not forcar:
+        em_cache = cache_produtos().obter(chave)
+        contar("cache.produtos.acertos" if em_cache else "cache.produtos.faltas")
+        if em_cache:
+            return em_cache
+    try:
+        produto = _ler_pagina_produto(url_nova)
+    except Exception as e:
+        logger.warning("falha ao buscar produto", extra=campos_log(url=url_nova, erro=f"{type(e).__name__}: {e}"))
+        return None
+    if produto:
+        cache_produtos().guardar(chave, produto)
+    return produto
+
+def buscar_produto_por_id(produto_id, forcar=False):
+    chave = f"sku:{produto_id}"
+    if not forcar:
+        em_cache = cache_produtos().obter(chave)
+        contar("cache.produtos.acertos" if em_cache else "cache.produtos.faltas")
+        if em_cache:
+            return em_cache
+    url_busca = f"{URL_LOJA}/s?q={produto_id}"
+    html_busca = baixar_html(url_busca)
+    with cronometrar("loja.html"):
+        soup_busca = BeautifulSoup(html_busca, "html.parser")
+        tag_link = soup_busca.find("script", {"type": "application/ld+json"})
+        dados = json.loads(tag_link.string)
+
+    # Extraindo produtos
+    produtos = dados.get("products", [])
+    if not produtos:
+        return None
+    resultado = []
+    for prod in produtos:
+        item = {
+            "nome": prod.get("alternateName"),
+            "preco": prod.get("offers", {}).get("offers", [{}])[0].get("price"),
+            "link": prod.get("url")
+        }
+    if item is None or item == {}:
+        return None
+    resultado.append(item)
+    url = resultado[0]['link'] if resultado else None
+    url = str(url).split("?")[0] + f"?skuId={produto_id}" if url else None
+    if not url:
+        return None
+    # a consulta já foi contada pela chave do skuId; a página é lida direto, sem nova consulta ao cache
+    url_nova = _ler_pagina_produto(url)
+    if url_nova:
+        cache_produtos().guardar(f"url:{url}", url_nova)
+        cache_produtos().guardar(chave, url_nova)
+    return url_nova
+
+def ler_sku_ids(texto="", arquivo_csv=None):
+    """Lê skuIds de um texto colado (separados por vírgula, espaço ou linha) e/ou de um CSV.
+
+    No CSV é usada a coluna "skuId" quando existir; caso contrário, a primeira coluna.
+    """
+    ids = [item for item in re.split(r"[\s,;]+", texto or "") if item]
+    if arquivo_csv is not None:
+        linhas = list(csv.reader(arquivo_csv.read().decode("utf-8-sig").splitlines()))
+        coluna = 0
+        if linhas and "skuid" in [c.strip().lower() for c in linhas[0]]:
+            coluna = [c.strip().lower() for c in linhas[0]].index("skuid")
+            linhas = linhas[1:]
+        ids += [linha[coluna].strip() for linha in linhas if len(linha) > coluna and linha[coluna].strip()]
+    return ids
+
+def _nao_encontrado(erro):
+    """A loja respondeu 404: o skuId não existe, não é uma falha da busca."""
+    return (
+        isinstance(erro, requests.HTTPError)
+        and erro.response is not None
+        and erro.response.status_code == 404
+    )
+
+def _buscar_produto_seguro(produto_id, forcar=False, falhas=None):
+    try:
+        return buscar_produto_por_id(produto_id, forcar=forcar)
+    except Exception as e:
+        if _nao_encontrado(e):
+            return None
+        erro = f"{type(e).__name__}: {e}"
+        logger.warning("falha ao buscar skuId", extra=campos_log(sku=produto_id, erro=erro))
+        if falhas is not None:
+            falhas[produto_id] = erro
+        return None
+
+def buscar_produtos_por_ids(ids, max_workers=BUSCA_MAX_WORKERS, ao_concluir=None, forcar=False, falhas=None):
+    """Busca vários skuIds em paralelo e devolve os resultados na ordem de entrada.
+
+    `ao_concluir(concluidos, total, prontos)` é chamado a cada item finalizado, onde
+    `prontos` é a lista de resultados que já podem ser emitidos em ordem desde a última
+    chamada (None para skuIds não encontrados ou com falha). Se `falhas` for um dict, os
+    skuIds cuja busca falhou (rede, timeout, 5xx após as tentativas...) são anotados nele
+    com a mensagem de erro, para não serem confundidos com os não encontrados.
+    """
+    resultados = [None] * len(ids)
+    finalizados = [False] * len(ids)
+    proximo = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # cada tarefa leva uma cópia do contexto, para as medições chegarem ao coletor da sessão
+        futuros = {
+            executor.submit(contextvars.copy_context().run, _buscar_produto_seguro, produto_id, forcar, falhas): i
+            for i, produto_id in enumerate(ids)
+        }
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            i = futuros[futuro]
+            resultados[i] = futuro.result()
+            finalizados[i] = True
+            inicio = proximo
+            while proximo < len(ids) and finalizados[proximo]:
+                proximo += 1
+            if ao_concluir:
+                ao_concluir(concluidos, len(ids), resultados[inicio:proximo])
+    return resultados
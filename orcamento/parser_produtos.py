@@ -0,0 +1,115 @@
+import re
+from collections import namedtuple
+
+_PRECO = r"\d{1,3}(?:\.\d{3})*,\d{2}"
+# Fim de cada produto: "[De <preço> Por] <preço> <quantidade> <total>". Sem quantificadores
+# aninhados nem curingas, o custo é linear no tamanho do texto.
+PADRAO_FECHAMENTO = re.compile(
+    rf"(?<!\S)(?:De\s+({_PRECO})\s+Por\s+)?({_PRECO})\s+\d+\s+({_PRECO})(?!\S)"
+)
+PADRAO_PALAVRA = re.compile(r"[\w/]+")
+PADRAO_MEDIDA = re.compile(r"\s*\d+\s*(?:CM|M)?(?:\s*X\s*\d+\s*(?:CM|M)?)?", re.IGNORECASE)
+PADRAO_CODIGO_INICIAL = re.compile(r"^\d+\s+")
+
+# Trechos de cabeçalho/rodapé que não são produtos.
+PADRAO_IGNORADOS = re.compile(r"nota|endereço|telefones|horários", re.IGNORECASE)
+
+# Limite de texto pendente sem fechar um produto (cabeçalhos, rodapés, lixo).
+MAX_TEXTO_PENDENTE = 20000
+
+LinhaProduto = namedtuple("LinhaProduto", "descricao grade_cor preco_de preco_por preco total")
+
+
+class ParserProdutos:
+    """Lê o texto da nota em uma única passada.
+
+    `PADRAO_FECHAMENTO` localiza o fim de cada produto; o trecho entre dois fechamentos é
+    separado em tokens uma única vez. A partir do primeiro token terminado em dígito (o
+    código do item), esse trecho é dividido em descrição e grade/cor: a grade/cor é a
+    maior sequência final de tokens só com letras, dígitos e "/".
+
+    O texto após o último fechamento é guardado entre chamadas de `alimentar`, o que
+    permite processar o documento página a página sem perder produtos divididos entre
+    páginas.
+    """
+
+    def __init__(self):
+        self._pendente = ""
+
+    def alimentar(self, texto):
+        """Processa mais um trecho de texto e devolve as `LinhaProduto` completadas nele."""
+        texto = self._pendente + texto
+        linhas = []
+        fim = 0
+        for match in PADRAO_FECHAMENTO.finditer(texto):
+            linha = _montar_linha(texto[fim:match.start()].split(), *match.groups())
+            if linha:
+                linhas.append(linha)
+            fim = match.end()
+        self._pendente = texto[fim:][-MAX_TEXTO_PENDENTE:]
+        return linhas
+
+
+def _montar_linha(tokens, preco_de, preco, total):
+    # Código do item: primeiro token terminado em dígito.
+    for inicio, token in enumerate(tokens):
+        if token[-1].isdecimal():
+            break
+    else:
+        return None
+    if len(tokens) - inicio < 3:
+        return None
+
+    # Grade/cor: maior sufixo de palavras, deixando ao menos um token para a descrição.
+    inicio_grade = len(tokens)
+    while inicio_grade - 1 > inicio + 1 and PADRAO_PALAVRA.fullmatch(tokens[inicio_grade - 1]):
+        inicio_grade -= 1
+    if inicio_grade == len(tokens):
+        return None
+
+    return LinhaProduto(
+        descricao=" ".join(tokens[inicio + 1:inicio_grade]),
+        grade_cor=" ".join(tokens[inicio_grade:]),
+        preco_de=preco_de,
+        preco_por=preco if preco_de else None,
+        preco=preco,
+        total=total,
+    )
+
+
+def remover_medidas(texto):
+  """Remove TODOS os padrões de medida de uma string."""
+  return PADRAO_MEDIDA.sub('', texto).strip()
+
+def montar_produto(linha):
+    """Converte uma `LinhaProduto` na tupla `(nome, medida, preco)` usada pelo app."""
+    desc = linha.descricao
+    if PADRAO_IGNORADOS.search(desc):
+        return None
+
+    if desc.count('-') >= 2:
+        desc = desc.split('-', 2)[2].strip()
+    elif '-' in desc:
+        desc = desc.split('-', 1)[1].strip()
+    elif '#' in desc:
+        desc = desc.split('#', 1)[1].strip()
+    else:
+        desc = PADRAO_CODIGO_INICIAL.sub("", desc)
+
+    # Medida que queremos manter, buscada na grade/cor.
+    medida = ""
+    match = PADRAO_MEDIDA.search(linha.grade_cor)
+    if match:
+        medida = match.group(0).strip()
+
+    if linha.preco_por:
+        preco = f"De R$ {linha.preco_de} Por R$ {linha.preco_por}"
+    else:
+        preco = f"R$ {linha.preco}"
+
+    return (remover_medidas(desc), medida, preco)
+
+def extrair_produtos_do_texto(texto):
+    """Atalho para processar um texto completo de uma vez."""
+    produtos = (montar_produto(linha) for linha in ParserProdutos().alimentar(texto))
+    return [produto for produto in produtos if produto]
@@ -0,0 +1,69 @@
+import base64
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from io import BytesIO
+
+from cachetools import LRUCache
+from PIL import Image
+from reportlab.lib.pagesizes import A4, A5, LETTER, LEGAL, landscape
+from reportlab.lib.utils import ImageReader
+
+from .diagnostico import contar
+from .layout_pdf import gerar_pdf
+from .rodape_logo import RODAPE_LOGO_BASE64
+
+FORMATOS_PAGINA = {
+    "A4 (21 x 29,7 cm)": A4,
+    "A5 (14,8 x 21 cm)": A5,
+    "Letter (21,6 x 27,9 cm)": LETTER,
+    "Legal (21,6 x 35,6 cm)": LEGAL,
+    "A4 Paisagem": landscape(A4)
+}
+
+MARGENS_PADRAO = (3.0, 1.0, 1.0)  # topo, base, lateral (cm)
+ALTURA_LOGO_PADRAO_CM = 2.0
+TITULO_GRANDE_PADRAO = "MUNDO DE INSPIRAÇÕES"
+TITULO_PEQUENO_PADRAO = "OUTONO–INVERNO 2025"
+
+PDF_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+@lru_cache(maxsize=None)
+def logo_rodape():
+    """Logo do rodapé decodificado uma única vez por processo: (imagem, largura, altura) em pixels."""
+    if not RODAPE_LOGO_BASE64.strip():
+        return None
+    image = Image.open(BytesIO(base64.b64decode(RODAPE_LOGO_BASE64)))
+    image.load()
+    return ImageReader(image), image.width, image.height
+
+@lru_cache(maxsize=None)
+def cache_pdfs():
+    """PDFs já gerados, indexados pelo hash do conteúdo e limitados em bytes (LRU)."""
+    return LRUCache(maxsize=PDF_CACHE_MAX_BYTES, getsizeof=len), threading.Lock()
+
+def chave_pdf(produtos, tamanho_pagina, margens, altura_logo_cm, titulo_grande, titulo_pequeno, colunas=1):
+    conteudo = json.dumps(
+        [[list(p) for p in produtos], list(tamanho_pagina), list(margens), altura_logo_cm, titulo_grande, titulo_pequeno, colunas],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+def gerar_pdf_em_cache(produtos, tamanho_pagina, margens, altura_logo_cm, titulo_grande, titulo_pequeno, colunas=1):
+    """Devolve os bytes do PDF, reaproveitando um documento idêntico já gerado."""
+    chave = chave_pdf(produtos, tamanho_pagina, margens, altura_logo_cm, titulo_grande, titulo_pequeno, colunas)
+    cache, lock = cache_pdfs()
+    with lock:
+        pdf_bytes = cache.get(chave)
+    contar("cache.pdf.acertos" if pdf_bytes is not None else "cache.pdf.faltas")
+    if pdf_bytes is not None:
+        return pdf_bytes
+    buffer = BytesIO()
+    gerar_pdf(produtos, buffer, tamanho_pagina, margens, altura_logo_cm, titulo_grande, titulo_pequeno,
+              colunas=colunas, logo=logo_rodape())
+    pdf_bytes = buffer.getvalue()
+    with lock:
+        if len(pdf_bytes) <= cache.maxsize:
+            cache[chave] = pdf_bytes
+    return pdf_bytes